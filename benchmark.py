@@ -0,0 +1,419 @@
+import os
+import io
+import sys
+import json
+import time
+import random
+import shutil
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+import contextlib
+from datetime import datetime, timezone
+
+
+# Pipeline modules (src.*) load models on import, so they are imported inside the
+# functions below. That way the offline settings in __main__ take effect first and
+# importing this module (e.g. for generate_corpus) has no side effects.
+
+FIRST_NAMES = ["Jane", "John", "Amara", "Wei", "Lucia", "Omar", "Priya", "Noah", "Sofia", "Kofi"]
+LAST_NAMES = ["Doe", "Smith", "Okafor", "Chen", "Garcia", "Haddad", "Patel", "Müller", "Rossi", "Mensah"]
+TITLES = ["Software Engineer", "Data Scientist", "Backend Developer", "ML Engineer",
+          "DevOps Engineer", "Frontend Developer", "Data Analyst", "Sales Manager"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Tech"]
+SKILLS = ["Python", "Java", "C++", "JavaScript", "HTML", "CSS", "SQL", "React", "Node.js",
+          "AWS", "Docker", "Kubernetes", "Machine Learning", "NLP", "PyTorch", "TensorFlow",
+          "Git", "Linux", "Excel", "Communication", "Scikit-learn", "Pandas", "NumPy"]
+VERBS = ["Built", "Designed", "Maintained", "Led", "Optimized", "Deployed", "Migrated", "Automated"]
+OBJECTS = ["a data pipeline", "REST APIs", "the reporting platform", "a recommendation engine",
+           "CI/CD workflows", "customer dashboards", "ETL jobs", "a search service"]
+
+JD_TEXT = """Job Title: Python Developer
+
+We are looking for a Python Developer with experience in Machine Learning and NLP.
+Requirements:
+- Strong knowledge of Python, SQL and Docker.
+- Experience with PyTorch or TensorFlow.
+- Familiarity with AWS and Kubernetes is a plus.
+- Good communication skills.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+def generate_resume_text(rng, length):
+    """
+    Builds one synthetic resume. `length` is the number of experience entries,
+    which is what drives document size (roughly 8 entries per PDF page).
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    email = f"{first.lower()}.{last.lower()}{rng.randint(1, 999)}@example.com"
+    phone = f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+    skills = rng.sample(SKILLS, rng.randint(4, 10))
+
+    lines = [
+        f"{first} {last}",
+        rng.choice(TITLES),
+        f"Email: {email} | Phone: {phone}",
+        "",
+        "Summary",
+        f"{rng.choice(TITLES)} with {rng.randint(1, 15)} years of experience in {', '.join(skills[:3])}.",
+        "",
+        "Experience",
+    ]
+    for _ in range(length):
+        year = rng.randint(2005, 2024)
+        lines.append(f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)} ({year} - {year + rng.randint(1, 4)})")
+        for _ in range(3):
+            lines.append(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(skills)} and {rng.choice(skills)}.")
+        lines.append("")
+
+    lines.append("Skills")
+    lines.append(", ".join(skills))
+    return "\n".join(lines)
+
+
+def write_txt(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def write_docx(path, text):
+    import docx
+    doc = docx.Document()
+    for line in text.split("\n"):
+        doc.add_paragraph(line)
+    doc.save(path)
+
+
+def write_pdf(path, text):
+    from fpdf import FPDF
+    from src.reporter import clean_text
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font('helvetica', '', 10)
+    for line in text.split("\n"):
+        pdf.multi_cell(0, 5, clean_text(line) or " ", new_x="LMARGIN", new_y="NEXT")
+    pdf.output(path)
+
+
+WRITERS = {
+    'txt': write_txt,
+    'docx': write_docx,
+    'pdf': write_pdf,
+}
+
+
+def generate_corpus(out_dir, size, length=3, formats=('txt',), seed=42):
+    """
+    Writes `size` synthetic resumes per format into out_dir/<format>/ plus a
+    job description at out_dir/jd.txt. Returns {format: [paths]}.
+    """
+    rng = random.Random(seed)
+    texts = [generate_resume_text(rng, length) for _ in range(size)]
+
+    os.makedirs(out_dir, exist_ok=True)
+    write_txt(os.path.join(out_dir, "jd.txt"), JD_TEXT)
+
+    corpus = {}
+    for fmt in formats:
+        if fmt not in WRITERS:
+            raise ValueError(f"Unsupported corpus format: {fmt}")
+        fmt_dir = os.path.join(out_dir, fmt)
+        os.makedirs(fmt_dir, exist_ok=True)
+        paths = []
+        for i, text in enumerate(texts):
+            path = os.path.join(fmt_dir, f"resume_{i:05d}.{fmt}")
+            WRITERS[fmt](path, text)
+            paths.append(path)
+        corpus[fmt] = paths
+    return corpus
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def working_directory(path):
+    prev = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(prev)
+
+
+def time_stage(fn, repeat, n_items):
+    """
+    Runs fn() `repeat` times and summarizes wall-clock timings.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        "items": n_items,
+        "min_s": round(best, 6),
+        "median_s": round(statistics.median(timings), 6),
+        "per_item_ms": round(best * 1000 / max(n_items, 1), 4),
+        "items_per_s": round(n_items / best, 2) if best > 0 else None,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(corpus, work_dir, repeat=3, stages=None, e2e=True):
+    """
+    Times each pipeline stage over the generated corpus and returns a results dict.
+    """
+    from src import parser as parser_module
+    from src import screener
+    from src.parser import extract_text_from_file
+    from src.extractor import ResumeDocument, extract_skills, extract_contact_info
+    from src.reporter import generate_report
+    from src.classifier import load_category_model, predict_categories
+    from src.screener import HashingEmbedder
+
+    jd_path = os.path.join(work_dir, "jd.txt")
+    jd_text = extract_text_from_file(jd_path)
+
+    embedder = "sbert"
+    if screener.model is None:
+        print("SBERT weights not available, using stub embedder.")
+        screener.model = HashingEmbedder()
+        embedder = "stub"
+
+    all_paths = [p for paths in corpus.values() for p in paths]
+    results = {}
+
+    def want(name):
+        return stages is None or name in stages
+
+    # Parse, per format and overall
+    if want("parse"):
+        for fmt, paths in corpus.items():
+            results[f"parse_{fmt}"] = time_stage(lambda: [extract_text_from_file(p, use_cache=False) for p in paths], repeat, len(paths))
+
+        cached = [p for fmt, paths in corpus.items() if fmt in ('pdf', 'docx') for p in paths]
+        if parser_module.CACHE_ENABLED and cached:
+            for p in cached:
+                extract_text_from_file(p)
+            results["parse_cached"] = time_stage(lambda: [extract_text_from_file(p) for p in cached], repeat, len(cached))
+
+    texts = [extract_text_from_file(p) for p in all_paths]
+    resumes_data = []
+
+    if want("skills"):
+        results["skills"] = time_stage(lambda: [extract_skills(t) for t in texts], repeat, len(texts))
+
+    if want("contact"):
+        results["contact"] = time_stage(lambda: [extract_contact_info(t) for t in texts], repeat, len(texts))
+
+    if want("extraction"):
+        def extract_all():
+            for t in texts:
+                doc = ResumeDocument(t)
+                extract_skills(doc)
+                extract_contact_info(doc)
+        results["extraction"] = time_stage(extract_all, repeat, len(texts))
+
+    if want("classify"):
+        if load_category_model():
+            results["classify"] = time_stage(lambda: predict_categories(texts, top_k=3), repeat, len(texts))
+        else:
+            print("Skipping classify benchmark: no trained category model in models/")
+
+    for path, text in zip(all_paths, texts):
+        doc = ResumeDocument(text)
+        resumes_data.append({
+            'filename': os.path.basename(path),
+            'text': text,
+            'skills': extract_skills(doc),
+            'contact': extract_contact_info(doc)
+        })
+
+    if want("embedding"):
+        results["embedding"] = time_stage(lambda: screener.model.encode([jd_text] + texts), repeat, len(texts))
+
+    if want("ranking"):
+        results["ranking"] = time_stage(lambda: screener.rank_resumes(resumes_data, jd_text), repeat, len(resumes_data))
+
+    if want("reporting"):
+        def report_all():
+            with working_directory(work_dir):
+                for resume in resumes_data:
+                    generate_report({
+                        "score": 0.0,
+                        "skills": resume['skills'],
+                        "contact": resume['contact'],
+                    }, jd_text, resume['filename'])
+        results["reporting"] = time_stage(report_all, repeat, len(resumes_data))
+
+    if e2e and want("main"):
+        results["main"] = time_stage(lambda: run_main(corpus, work_dir, jd_path), repeat, len(all_paths))
+
+    if e2e and want("analyze"):
+        analyze = make_analyze_runner(all_paths, jd_text, work_dir)
+        if analyze:
+            results["analyze"] = time_stage(analyze, repeat, len(all_paths))
+
+    return embedder, results
+
+
+def run_main(corpus, work_dir, jd_path):
+    """
+    Runs the CLI entry point once per format folder, discarding console output.
+    """
+    import main as cli
+    for fmt in corpus:
+        argv = ["main.py", "--resumes", os.path.join(work_dir, fmt), "--jd_file", jd_path]
+        with working_directory(work_dir), \
+                contextlib.redirect_stdout(io.StringIO()), \
+                patched_argv(argv):
+            cli.main()
+
+
+@contextlib.contextmanager
+def patched_argv(argv):
+    prev = sys.argv
+    sys.argv = argv
+    try:
+        yield
+    finally:
+        sys.argv = prev
+
+
+def make_analyze_runner(paths, jd_text, work_dir):
+    """
+    Returns a callable that posts every resume to /analyze in-process,
+    or None when the FastAPI test client is not installed.
+    """
+    try:
+        from fastapi.testclient import TestClient
+        import server
+    except Exception as e:
+        print(f"Skipping /analyze benchmark: {e}")
+        return None
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    client = TestClient(server.app)
+
+    def analyze_all():
+        with working_directory(work_dir), contextlib.redirect_stdout(io.StringIO()):
+            os.makedirs(server.UPLOAD_DIR, exist_ok=True)
+            for path in paths:
+                with open(path, 'rb') as f:
+                    resp = client.post("/analyze",
+                                       files={"resume": (os.path.basename(path), f)},
+                                       data={"job_description": jd_text})
+                if resp.status_code != 200:
+                    raise RuntimeError(f"/analyze failed for {path}: {resp.text}")
+    return analyze_all
+
+
+def compare_results(baseline, current):
+    """
+    Prints per-stage speedups of `current` relative to `baseline` (both results dicts).
+    """
+    print(f"\n{'stage':<14}{'baseline ms':>14}{'current ms':>14}{'speedup':>10}")
+    for stage, cur in current["stages"].items():
+        base = baseline["stages"].get(stage)
+        if not base:
+            print(f"{stage:<14}{'-':>14}{cur['per_item_ms']:>14.3f}{'-':>10}")
+            continue
+        speedup = base['per_item_ms'] / cur['per_item_ms'] if cur['per_item_ms'] else float('inf')
+        print(f"{stage:<14}{base['per_item_ms']:>14.3f}{cur['per_item_ms']:>14.3f}{speedup:>9.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume screening benchmark suite")
+    parser.add_argument("--size", type=int, default=50, help="Number of resumes per format")
+    parser.add_argument("--length", type=int, default=3, help="Experience entries per resume (~8 per PDF page)")
+    parser.add_argument("--formats", default="txt,docx,pdf", help="Comma-separated corpus formats")
+    parser.add_argument("--stages", help="Comma-separated subset of stages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions per stage")
+    parser.add_argument("--seed", type=int, default=42, help="Corpus random seed")
+    parser.add_argument("--work_dir", default="bench_work", help="Where the corpus and outputs are written")
+    parser.add_argument("--no_e2e", action="store_true", help="Skip the main.py and /analyze runs")
+    parser.add_argument("--output", default="bench_results.json", help="JSON results file")
+    parser.add_argument("--compare", help="Previous JSON results file to compare against")
+    parser.add_argument("--no_cache", action="store_true", help="Disable the parsed-text cache")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated corpus after the run")
+
+    args = parser.parse_args()
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    stages = set(s.strip() for s in args.stages.split(",")) if args.stages else None
+    work_dir = os.path.abspath(args.work_dir)
+
+    from src import parser as parser_module
+    from src.cache import ParseCache
+
+    if args.no_cache:
+        parser_module.CACHE_ENABLED = False
+    else:
+        # Start from a cold cache that lives with the corpus
+        cache = ParseCache(os.path.join(work_dir, "parse_cache.sqlite"))
+        cache.clear()
+        parser_module.set_parse_cache(cache)
+
+    print(f"Generating {args.size} resumes x {formats} (length={args.length}) in {work_dir}...")
+    corpus = generate_corpus(work_dir, args.size, args.length, formats, args.seed)
+
+    try:
+        embedder, stage_results = run_benchmarks(corpus, work_dir, args.repeat, stages, not args.no_e2e)
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "embedder": embedder,
+            "config": {
+                "size": args.size,
+                "length": args.length,
+                "formats": formats,
+                "repeat": args.repeat,
+                "seed": args.seed,
+                "parse_cache": not args.no_cache,
+            },
+        },
+        "stages": stage_results,
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n{'stage':<14}{'items':>8}{'min s':>12}{'ms/item':>12}{'items/s':>12}")
+    for stage, r in stage_results.items():
+        print(f"{stage:<14}{r['items']:>8}{r['min_s']:>12.4f}{r['per_item_ms']:>12.3f}{r['items_per_s'] or 0:>12.1f}")
+    print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_results(json.load(f), results)
+
+
+if __name__ == "__main__":
+    # The benchmark must be reproducible without network access. Cached model
+    # weights are still picked up; anything missing falls back to the stub embedder.
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+    main()
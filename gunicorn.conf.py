@@ -0,0 +1,29 @@
+# Production serving config: gunicorn + uvicorn workers.
+#
+#   gunicorn -c gunicorn.conf.py server:app
+#
+# The app (and with it SBERT, BERT and the sklearn models) is imported and
+# warmed up once in the parent before workers are forked; see
+# src.warmup.warm_up_before_fork.
+import os
+import multiprocessing
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", max(2, multiprocessing.cpu_count() // 2)))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+# Worker timeout (seconds); screening large PDFs can take a while
+timeout = int(os.environ.get("WORKER_TIMEOUT", "120"))
+graceful_timeout = 30
+
+# Torch intra-op threads per worker. Defaults to an even split of the CPUs.
+torch_threads = int(os.environ.get("TORCH_THREADS_PER_WORKER", max(1, multiprocessing.cpu_count() // workers)))
+
+def when_ready(arbiter):
+    # Runs in the parent after the app is preloaded and before any worker forks.
+    from src.warmup import warm_up_before_fork
+    warm_up_before_fork()
+
+def post_fork(arbiter, worker):
+    from src.warmup import set_torch_threads
+    set_torch_threads(torch_threads)
@@ -1,21 +1,77 @@
 import os
 import argparse
 from src.parser import extract_text_from_file
-from src.extractor import extract_skills, extract_contact_info
-from src.screener import rank_resumes
+from src.extractor import ResumeDocument, extract_skills, extract_contact_info
+from src.screener import score_matrix, rank_against_jobs
+from src.results import ResultsWriter, TopResults, write_table
+from src.classifier import predict_category
 import pandas as pd
 
+def process_resume(filepath):
+    """
+    Parses one resume and extracts skills and contact info.
+    Returns None if no text could be extracted.
+    """
+    text = extract_text_from_file(filepath)
+    if not text:
+        return None
+    doc = ResumeDocument(text)
+    return {
+        'filename': os.path.basename(filepath),
+        'text': text,
+        'skills': extract_skills(doc),
+        'contact': extract_contact_info(doc)
+    }
+
+def load_job_descriptions(jd_dir):
+    """
+    Loads every job description in a folder. Returns {filename: text}.
+    """
+    job_descriptions = {}
+    for filename in sorted(os.listdir(jd_dir)):
+        path = os.path.join(jd_dir, filename)
+        if not os.path.isfile(path):
+            continue
+        text = extract_text_from_file(path)
+        if text:
+            job_descriptions[filename] = text
+        else:
+            print(f"Could not extract text from Job Description: {filename}")
+    return job_descriptions
+
 def main():
     parser = argparse.ArgumentParser(description="Automated Resume Screening Tool")
     parser.add_argument("--resumes", default="data/resumes", help="Path to resumes folder")
     parser.add_argument("--jd", default="data/job_descriptions", help="Path to job descriptions folder")
     parser.add_argument("--jd_file", help="Specific JD file to use (optional)")
+    parser.add_argument("--multi_jd", action="store_true", help="Screen against every JD in the --jd folder in one pass")
+    parser.add_argument("--top_k", type=int, default=10, help="Shortlist size per JD in --multi_jd mode")
+    parser.add_argument("--shortlist_out", default="shortlists.csv", help="Per-JD shortlist output (.csv, or .parquet for a single file)")
+    parser.add_argument("--output", default="results.csv", help="Results file (.csv, or .parquet for a directory of row groups); unreadable resumes get an empty score")
+    parser.add_argument("--chunk_size", type=int, default=500, help="Resumes scored and written per chunk")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted run, skipping resumes already in --output")
+    parser.add_argument("--top_n", type=int, default=20, help="Number of top candidates printed to the console")
+    parser.add_argument("--best_fit_out", default="best_fit.csv", help="Best-fit JD per candidate output (.csv, or .parquet for a single file)")
     
     args = parser.parse_args()
     
-    # 1. Load Job Description
+    # 1. Load Job Description(s)
     jd_text = ""
-    if args.jd_file:
+    job_descriptions = {}
+    if args.multi_jd:
+        if args.top_k < 1:
+             print("--top_k must be at least 1")
+             return
+        if not os.path.exists(args.jd):
+             print(f"Job descriptions folder not found: {args.jd}")
+             return
+
+        job_descriptions = load_job_descriptions(args.jd)
+        if not job_descriptions:
+             print(f"No job descriptions found in {args.jd}")
+             return
+        print(f"Screening against {len(job_descriptions)} job descriptions")
+    elif args.jd_file:
          jd_text = extract_text_from_file(args.jd_file)
     else:
         # Just pick the first file in the JD folder for now
@@ -32,7 +88,7 @@ def main():
         print(f"Using Job Description: {jd_files[0]}")
         jd_text = extract_text_from_file(jd_path)
 
-    if not jd_text:
+    if not jd_text and not job_descriptions:
         print("Could not extract text from Job Description.")
         return
 
@@ -41,7 +97,6 @@ def main():
         print(f"Resumes folder not found: {args.resumes}")
         return
 
-    resumes_data = []
     resume_files = [f for f in os.listdir(args.resumes) if f.lower().endswith(('.pdf', '.docx', '.txt'))]
     
     if not resume_files:
@@ -49,32 +104,87 @@ def main():
         return
 
     print(f"Processing {len(resume_files)} resumes...")
-    
-    for filename in resume_files:
-        filepath = os.path.join(args.resumes, filename)
-        text = extract_text_from_file(filepath)
-        
-        if text:
-            skills = extract_skills(text)
-            contact = extract_contact_info(text)
-            resumes_data.append({
-                'filename': filename,
-                'text': text,
-                'skills': skills,
-                'contact': contact
-            })
 
     # 3. Rank and Score
-    ranked = rank_resumes(resumes_data, jd_text)
-    
+    if args.multi_jd:
+        resumes_data = []
+        for filename in resume_files:
+            resume = process_resume(os.path.join(args.resumes, filename))
+            if resume:
+                resumes_data.append(resume)
+
+        # One batched classifier call for the whole pool
+        categories = predict_category([r['text'] for r in resumes_data])
+        for resume, (category, _) in zip(resumes_data, categories):
+            resume['category'] = category
+
+        shortlists, best_fit = rank_against_jobs(resumes_data, job_descriptions, top_k=args.top_k)
+
+        print("\n--- Shortlists per Job Description ---")
+        shortlist_rows = []
+        for jd_name, rows in shortlists.items():
+            print(f"\n{jd_name}")
+            if rows:
+                print(pd.DataFrame(rows)[['rank', 'filename', 'score', 'email']].to_string(index=False))
+            shortlist_rows.extend(rows)
+
+        write_table(shortlist_rows, ['jd', 'rank', 'filename', 'score', 'email', 'phone', 'skills', 'category'], args.shortlist_out)
+        write_table(best_fit, ['filename', 'jd', 'score', 'email', 'phone', 'skills', 'category'], args.best_fit_out)
+        print(f"\nShortlists saved to {args.shortlist_out}")
+        print(f"Best-fit JD per candidate saved to {args.best_fit_out}")
+        return
+
+    # Single JD: score chunk by chunk and stream rows to disk as we go
+    top = TopResults(args.top_n)
+    try:
+        writer = ResultsWriter(args.output, chunk_size=args.chunk_size, resume=args.resume, top=top)
+    except ValueError as e:
+        print(e)
+        return
+
+    with writer:
+        pending = [f for f in resume_files if f not in writer.completed]
+        if writer.completed:
+            print(f"Resuming: {len(writer.completed)} already scored, {len(pending)} remaining")
+
+        for start in range(0, len(pending), args.chunk_size):
+            chunk = []
+            unreadable = []
+            for filename in pending[start:start + args.chunk_size]:
+                resume = process_resume(os.path.join(args.resumes, filename))
+                if resume:
+                    chunk.append(resume)
+                else:
+                    unreadable.append(filename)
+
+            # Record resumes without text (empty score) so --resume doesn't parse them again
+            writer.write([{'filename': f, 'score': None} for f in unreadable])
+            if not chunk:
+                continue
+
+            texts = [r['text'] for r in chunk]
+            scores = score_matrix(texts, [jd_text])
+            categories = predict_category(texts)
+            rows = [{
+                'filename': r['filename'],
+                'score': float(scores[i, 0]),
+                'email': r['contact'].get('email'),
+                'phone': r['contact'].get('phone'),
+                'skills': r['skills'],
+                'category': categories[i][0],
+                'category_prob': categories[i][1],
+            } for i, r in enumerate(chunk)]
+            writer.write(rows)
+            top.add(rows)
+            print(f"Scored {min(start + args.chunk_size, len(pending))}/{len(pending)}")
+
     # 4. Output Results
-    print("\n--- Recruitment Results ---\n")
-    df = pd.DataFrame(ranked)
-    print(df[['filename', 'score', 'email', 'skills']].to_string(index=False))
-    
-    # Save to CSV
-    df.to_csv("results.csv", index=False)
-    print("\nResults saved to results.csv")
+    print(f"\n--- Recruitment Results (top {args.top_n}) ---\n")
+    df = pd.DataFrame(top.sorted(), columns=['filename', 'score', 'email', 'category', 'skills'])
+    df['skills'] = df['skills'].apply(', '.join)
+    print(df.to_string(index=False))
+
+    print(f"\nResults saved to {args.output}")
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,29 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
 import uvicorn
+import argparse
 import shutil
 import os
 import uuid
 from typing import List
-import joblib
 
 # Import our NLP logic
 from src.parser import extract_text_from_file
-from src.extractor import extract_skills, extract_contact_info
+from src.extractor import ResumeDocument, extract_skills, extract_contact_info
 from src.screener import calculate_similarity
+from src.classifier import predict_category, predict_categories
+from src.warmup import warm_up, warmup_state
+from src.jobs import JobStore, JOBS_BATCH_SIZE
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app):
+    # No-op when the preloading parent already warmed up
+    warm_up()
+    yield
+
+app = FastAPI(lifespan=lifespan)
 
 # Enable CORS for React frontend (dev mode)
 app.add_middleware(
@@ -26,6 +37,15 @@ app.add_middleware(
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Global job store, opened on first use (jobs are processed by worker.py)
+job_store = None
+
+def get_job_store():
+    global job_store
+    if job_store is None:
+        job_store = JobStore()
+    return job_store
+
 @app.post("/analyze")
 async def analyze_resume(
     resume: UploadFile = File(...),
@@ -50,33 +70,16 @@ async def analyze_resume(
              raise HTTPException(status_code=400, detail="Could not extract text from file.")
         
         # 2. Extract Skills & Info
-        skills = extract_skills(resume_text)
-        info = extract_contact_info(resume_text)
+        doc = ResumeDocument(resume_text)
+        skills = extract_skills(doc)
+        info = extract_contact_info(doc)
         
         # 3. Categorize Resume
         category = "Unknown"
-        if os.path.exists("models/category_model.pkl"):
-            try:
-                clf = joblib.load("models/category_model.pkl")
-                enc = joblib.load("models/category_encoder.pkl")
-                
-                # Clean text before predicting (same logic as training)
-                import re
-                def clean(text):
-                    clean = re.sub('http\S+\s*', ' ', text)
-                    clean = re.sub('RT|cc', ' ', clean)
-                    clean = re.sub('#\S+', '', clean)
-                    clean = re.sub('@\S+', '  ', clean)
-                    clean = re.sub('[%s]' % re.escape("""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""), ' ', clean)
-                    clean = re.sub(r'[^\x00-\x7f]',r' ', clean)
-                    clean = re.sub('\s+', ' ', clean)
-                    return clean.lower()
-                    
-                cleaned_text = clean(resume_text)
-                prediction = clf.predict([cleaned_text])
-                category = enc.inverse_transform(prediction)[0]
-            except Exception as e:
-                print(f"Classification failed: {e}")
+        try:
+            category = predict_category([resume_text])[0][0]
+        except Exception as e:
+            print(f"Classification failed: {e}")
 
         # 4. Calculate Score
         score = calculate_similarity(resume_text, job_description)
@@ -107,8 +110,97 @@ async def analyze_resume(
         print(f"Error processing file: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/classify")
+async def classify_resumes(
+    resumes: List[UploadFile] = File(...),
+    top_k: int = Form(3)
+):
+    """
+    Batch endpoint: predicts the top-k categories for many resumes in one model call.
+    """
+    if top_k < 1:
+        raise HTTPException(status_code=400, detail="top_k must be at least 1")
+
+    names, texts = [], []
+    for resume in resumes:
+        file_ext = os.path.splitext(resume.filename)[1]
+        temp_path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4()}{file_ext}")
+        try:
+            with open(temp_path, "wb") as buffer:
+                shutil.copyfileobj(resume.file, buffer)
+            text = extract_text_from_file(temp_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        names.append(resume.filename)
+        texts.append(text or "")
+
+    predictions = predict_categories(texts, top_k=top_k)
+    return {
+        "results": [
+            {
+                "filename": name,
+                "category": preds[0][0] if preds and text else "Unknown",
+                "categories": [{"category": c, "probability": p} for c, p in preds] if text else [],
+            }
+            for name, text, preds in zip(names, texts, predictions)
+        ]
+    }
+
+@app.post("/jobs", status_code=202)
+async def submit_job(
+    resumes: List[UploadFile] = File(...),
+    job_description: str = Form(...),
+    batch_size: int = Form(JOBS_BATCH_SIZE)
+):
+    """
+    Queues a screening job for a pool of resumes and returns its id immediately.
+    Batches are processed by local worker processes (see worker.py).
+    """
+    if batch_size < 1:
+        raise HTTPException(status_code=400, detail="batch_size must be at least 1")
+
+    store = get_job_store()
+    job_id = store.new_job_id()
+    files = []
+    for i, resume in enumerate(resumes):
+        file_ext = os.path.splitext(resume.filename)[1]
+        path = os.path.join(store.job_dir(job_id), f"{i:06d}{file_ext}")
+        with open(path, "wb") as buffer:
+            shutil.copyfileobj(resume.file, buffer)
+        files.append((resume.filename, path))
+
+    store.create_job(job_id, job_description, files, batch_size=batch_size)
+    return {"job_id": job_id, "status": "queued", "total": len(files)}
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, limit: int = Query(50, ge=1, le=1000)):
+    """
+    Returns job progress and the current top-`limit` ranked results (partial while running).
+    """
+    job = get_job_store().get_job(job_id, limit=limit)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
 from fastapi.responses import FileResponse
 
+@app.get("/healthz")
+async def liveness():
+    """
+    Liveness probe: the worker process is up and serving.
+    """
+    return {"status": "alive", "pid": os.getpid()}
+
+@app.get("/readyz")
+async def readiness():
+    """
+    Readiness probe: 200 only once models are loaded and warmed up.
+    """
+    if not warmup_state["ready"]:
+        return JSONResponse(status_code=503, content={"status": "warming_up"})
+    return {"status": "ready", "warmup_seconds": warmup_state["seconds"], "models": warmup_state["models"]}
+
 @app.get("/report/{filename}")
 async def get_report(filename: str):
     file_path = os.path.join("reports", filename)
@@ -117,4 +209,17 @@ async def get_report(filename: str):
     raise HTTPException(status_code=404, detail="Report not found")
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    parser = argparse.ArgumentParser(description="Resume AI API server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes; more than 1 runs gunicorn with models preloaded before fork")
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        # Hand over to gunicorn so workers share the preloaded model memory
+        os.environ["WEB_CONCURRENCY"] = str(args.workers)
+        os.environ["BIND"] = f"{args.host}:{args.port}"
+        os.execvp("gunicorn", ["gunicorn", "-c", "gunicorn.conf.py", "server:app"])
+
+    uvicorn.run(app, host=args.host, port=args.port)
@@ -0,0 +1,167 @@
+import os
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+
+# Defaults can be overridden per deployment without code changes.
+CACHE_PATH = os.environ.get("RESUME_CACHE_PATH", os.path.join(".cache", "parsed_text.sqlite"))
+CACHE_MAX_MB = float(os.environ.get("RESUME_CACHE_MAX_MB", "256"))
+CACHE_EVICTION = os.environ.get("RESUME_CACHE_EVICTION", "lru")
+CACHE_ENABLED = os.environ.get("RESUME_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+
+EVICTION_POLICIES = {
+    # Policy name -> column ordering the oldest entries first
+    "lru": "last_access",
+    "fifo": "created",
+}
+# Entries read per eviction query once the cache is over its size limit
+EVICTION_BATCH = 64
+
+
+def local_connection(local, path):
+    """
+    Returns this thread's connection to the SQLite database at `path`, stored on
+    `local` (a threading.local). Connections are opened in WAL mode with a busy
+    timeout and reopened after a fork, since they must not cross a fork or be
+    shared between threads.
+    """
+    conn = getattr(local, "conn", None)
+    if conn is None or local.pid != os.getpid():
+        conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        local.conn = conn
+        local.pid = os.getpid()
+    return conn
+
+
+def content_key(data, namespace=""):
+    """
+    Returns the cache key for raw file bytes. `namespace` separates entries that
+    hash the same but are parsed differently (e.g. the file extension).
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    return f"{namespace}:{digest}" if namespace else digest
+
+
+class ParseCache:
+    """
+    Size-bounded, content-addressed store of extracted text backed by SQLite.
+
+    Text is stored zlib-compressed. The database runs in WAL mode with a busy
+    timeout so several server workers (processes or threads) can share one file;
+    each thread/process opens its own connection.
+    """
+
+    def __init__(self, path=CACHE_PATH, max_bytes=int(CACHE_MAX_MB * 1024 * 1024), eviction=CACHE_EVICTION):
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {eviction} (expected one of {list(EVICTION_POLICIES)})")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            # Small columns come before the BLOB so reading them never walks its overflow pages
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    data BLOB NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON entries(last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_created ON entries(created)")
+            # Running total of entry sizes, kept in step with `entries` by put/clear
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (name, value) "
+                "SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM entries "
+                "WHERE NOT EXISTS (SELECT 1 FROM meta WHERE name = 'total_bytes')"
+            )
+
+    def _connect(self):
+        return local_connection(self._local, self.path)
+
+    def get(self, key):
+        """
+        Returns the cached text for `key`, or None on a miss.
+        """
+        conn = self._connect()
+        row = conn.execute("SELECT data FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if self.eviction == "lru":
+            conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, key, text):
+        """
+        Stores `text` under `key` and evicts old entries beyond max_bytes.
+        """
+        data = zlib.compress(text.encode("utf-8"))
+        if len(data) > self.max_bytes:
+            return
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            previous = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, size, created, last_access, data) VALUES (?, ?, ?, ?, ?)",
+                (key, len(data), now, now, data),
+            )
+            self._add_bytes(conn, len(data) - (previous[0] if previous else 0))
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _add_bytes(self, conn, delta):
+        conn.execute("UPDATE meta SET value = value + ? WHERE name = 'total_bytes'", (delta,))
+
+    def _total_bytes(self, conn):
+        return conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def _evict(self, conn):
+        # Deletes the oldest entries a batch at a time, walking the policy's index
+        total = self._total_bytes(conn)
+        order = EVICTION_POLICIES[self.eviction]
+        freed = 0
+        while total - freed > self.max_bytes:
+            victims = conn.execute(
+                f"SELECT key, size FROM entries ORDER BY {order} ASC LIMIT ?", (EVICTION_BATCH,)
+            ).fetchall()
+            if not victims:
+                break
+            for key, size in victims:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                freed += size
+                if total - freed <= self.max_bytes:
+                    break
+        if freed:
+            self._add_bytes(conn, -freed)
+
+    def stats(self):
+        conn = self._connect()
+        count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        total = self._total_bytes(conn)
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes, "eviction": self.eviction}
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM entries")
+            conn.execute("UPDATE meta SET value = 0 WHERE name = 'total_bytes'")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
@@ -16,16 +16,76 @@ MODEL_DIR = "models"
 MODEL_PATH = os.path.join(MODEL_DIR, "category_model.pkl")
 ENCODER_PATH = os.path.join(MODEL_DIR, "category_encoder.pkl")
 
+# Cleaning patterns, compiled once (applied in this order)
+CLEAN_PATTERNS = [
+    (re.compile(r'http\S+\s*'), ' '),
+    (re.compile('RT|cc'), ' '),
+    (re.compile(r'#\S+'), ''),
+    (re.compile(r'@\S+'), '  '),
+    (re.compile('[%s]' % re.escape(r"""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~""")), ' '),
+    (re.compile(r'[^\x00-\x7f]'), r' '),
+    (re.compile(r'\s+'), ' '),
+]
+
+# Global variables for the trained model, loaded on first use
+category_model = None
+category_encoder = None
+
 def clean_resume(text):
-    clean = re.sub('http\S+\s*', ' ', text)
-    clean = re.sub('RT|cc', ' ', clean)
-    clean = re.sub('#\S+', '', clean)
-    clean = re.sub('@\S+', '  ', clean)
-    clean = re.sub('[%s]' % re.escape("""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""), ' ', clean)
-    clean = re.sub(r'[^\x00-\x7f]',r' ', clean)
-    clean = re.sub('\s+', ' ', clean)
+    clean = text
+    for pattern, repl in CLEAN_PATTERNS:
+        clean = pattern.sub(repl, clean)
     return clean.lower()
 
+def load_category_model():
+    """
+    Loads the trained category pipeline and label encoder once per process.
+    Returns True if the model is available.
+    """
+    global category_model, category_encoder
+
+    if category_model is None and os.path.exists(MODEL_PATH) and os.path.exists(ENCODER_PATH):
+        try:
+            category_model = joblib.load(MODEL_PATH)
+            category_encoder = joblib.load(ENCODER_PATH)
+        except Exception as e:
+            print(f"Error loading category model: {e}")
+            category_model = category_encoder = None
+    return category_model is not None
+
+def predict_categories(texts, top_k=1):
+    """
+    Predicts the category of many resumes at once.
+    All texts go through a single TF-IDF transform and one predict_proba call.
+    Returns one list of (category, probability) pairs per text, best first,
+    or empty lists if no trained model is available.
+    """
+    if top_k < 1:
+        raise ValueError(f"top_k must be at least 1, got {top_k}")
+    if not texts:
+        return []
+    if not load_category_model():
+        return [[] for _ in texts]
+
+    cleaned = [clean_resume(t) for t in texts]
+    proba = category_model.predict_proba(cleaned)
+
+    labels = category_encoder.inverse_transform(category_model.classes_)
+    top_k = min(top_k, proba.shape[1])
+    top = np.argsort(-proba, axis=1)[:, :top_k]
+
+    return [
+        [(str(labels[j]), round(float(proba[i, j]), 4)) for j in row]
+        for i, row in enumerate(top)
+    ]
+
+def predict_category(texts):
+    """
+    Convenience wrapper returning the single best (category, probability) per text,
+    with ("Unknown", 0.0) when no model is available.
+    """
+    return [preds[0] if preds else ("Unknown", 0.0) for preds in predict_categories(texts, top_k=1)]
+
 def train_classifier():
     if not os.path.exists(DATA_PATH):
         print(f"Dataset not found at {DATA_PATH}")
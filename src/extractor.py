@@ -1,9 +1,59 @@
 import re
 import os
 import joblib
+from functools import cached_property
 
 # Global variable for model
 bert_nlp = None
+bert_unavailable = False
+
+# BERT has a token limit (usually 512), so only the first chunk of text is used.
+BERT_MAX_CHARS = 2000
+
+COMMON_SKILLS = [
+    "python", "java", "c++", "javascript", "html", "css", "sql", "react", 
+    "node.js", "aws", "docker", "kubernetes", "machine learning", "nlp",
+    "pytorch", "tensorflow", "git", "linux", "excel", "communication",
+    "scikit-learn", "pandas", "numpy"
+]
+
+# Precompiled patterns. All common skills are matched in a single pass over
+# the lowercased text; \b on both sides keeps "java" from matching "javascript".
+SKILLS_PATTERN = re.compile(r'\b(?:' + '|'.join(re.escape(s) for s in COMMON_SKILLS) + r')\b')
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+
+class ResumeDocument:
+    """
+    A resume's text, analysed once and shared by every extractor.
+    The lowercase form, token list and ML features are computed on first use
+    and cached, so contact, regex, ML and BERT extraction don't redo the work.
+    """
+
+    def __init__(self, text):
+        self.text = text or ""
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self):
+        return self.text.split()
+
+    @cached_property
+    def features(self):
+        return [get_features(t) for t in self.tokens]
+
+    @cached_property
+    def bert_input(self):
+        return self.text[:BERT_MAX_CHARS]
+
+def as_document(text):
+    """
+    Accepts either raw text or a ResumeDocument.
+    """
+    return text if isinstance(text, ResumeDocument) else ResumeDocument(text)
 
 def extract_skills_bert(text):
     """
@@ -14,21 +64,23 @@ def extract_skills_bert(text):
     to prevent DLL crashes on Windows systems that have broken PyTorch.
     On Docker (Linux), this will import successfully.
     """
-    global bert_nlp
+    global bert_nlp, bert_unavailable
     
     if bert_nlp is None:
+        if bert_unavailable:
+            return []
         try:
             from transformers import pipeline
             bert_nlp = pipeline('token-classification', model='yashpwr/resume-ner-bert-v2', aggregation_strategy='simple')
         except Exception:
-            # Silent failure or log once
+            # Don't retry the (slow) load for every resume
+            bert_unavailable = True
             return []
 
     try:
-        # BERT has a token limit (usually 512). We process the first chunk of text.
         # For a full implementation, we'd overlap-chunk the text.
         # Truncate to ~2000 chars roughly to avoid massive inputs, though pipeline handles some.
-        results = bert_nlp(text[:2000])
+        results = bert_nlp(as_document(text).bert_input)
         
         skills = set()
         for entity in results:
@@ -74,11 +126,13 @@ def extract_skills_ml(text):
     if not clf or not vec:
         return []
 
-    tokens = text.split()
-    features = [get_features(t) for t in tokens]
+    doc = as_document(text)
+    tokens = doc.tokens
+    if not tokens:
+        return []
     
     # Vectorize
-    X = vec.transform(features)
+    X = vec.transform(doc.features)
     
     # Predict
     preds = clf.predict(X)
@@ -96,43 +150,34 @@ def extract_skills_ml(text):
 def extract_skills(text):
     """
     Extracts potential skills using ML model first, then falls back/augments with Regex.
+    Accepts raw text or a ResumeDocument (preferred when running several extractors).
     """
+    doc = as_document(text)
     found_skills = set()
     
     # 1. BERT Extraction (Highest Priority)
-    found_skills.update(extract_skills_bert(text))
+    found_skills.update(extract_skills_bert(doc))
     
     # 2. ML Extraction (Scikit-Learn)
     if clf:
-        ml_skills = extract_skills_ml(text)
+        ml_skills = extract_skills_ml(doc)
         found_skills.update(ml_skills)
 
     # 3. Regex Extraction (Fallback)
     # Hybrid approach is usually best
-    common_skills = [
-        "python", "java", "c++", "javascript", "html", "css", "sql", "react", 
-        "node.js", "aws", "docker", "kubernetes", "machine learning", "nlp",
-        "pytorch", "tensorflow", "git", "linux", "excel", "communication",
-        "scikit-learn", "pandas", "numpy"
-    ]
-    
-    for skill in common_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE):
-            found_skills.add(skill)
+    found_skills.update(m.group(0) for m in SKILLS_PATTERN.finditer(doc.lower))
 
     return list(found_skills)
 
 def extract_contact_info(text):
     """
-    Extracts email and phone number.
+    Extracts email and phone number (first match of each).
     """
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    phone_pattern = r'(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'
-    
-    email = re.findall(email_pattern, text)
-    phone = re.findall(phone_pattern, text)
+    doc = as_document(text)
+    email = EMAIL_PATTERN.search(doc.text)
+    phone = PHONE_PATTERN.search(doc.text)
     
     return {
-        "email": email[0] if email else None,
-        "phone": phone[0] if phone else None
+        "email": email.group(0) if email else None,
+        "phone": phone.group(0) if phone else None
     }
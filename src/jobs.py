@@ -0,0 +1,355 @@
+import os
+import json
+import time
+import uuid
+import shutil
+import threading
+
+from src.cache import local_connection
+from src.parser import extract_text_from_file
+from src.extractor import ResumeDocument, extract_skills, extract_contact_info
+from src.screener import score_matrix
+from src.classifier import predict_category
+
+JOBS_DIR = os.environ.get("JOBS_DIR", "jobs")
+JOBS_DB_PATH = os.environ.get("JOBS_DB_PATH", os.path.join(JOBS_DIR, "jobs.sqlite"))
+JOBS_BATCH_SIZE = int(os.environ.get("JOBS_BATCH_SIZE", "64"))
+# A claimed task is handed to another worker if not finished within this many seconds
+JOBS_TASK_LEASE = float(os.environ.get("JOBS_TASK_LEASE", "1800"))
+# A task whose worker keeps dying (e.g. OOM on one batch) is failed after this many claims
+JOBS_MAX_ATTEMPTS = int(os.environ.get("JOBS_MAX_ATTEMPTS", "3"))
+
+class TaskLost(Exception):
+    """
+    Raised when completing a task this worker no longer holds (its lease expired).
+    """
+
+class JobStore:
+    """
+    SQLite-backed queue for asynchronous screening jobs (no external broker).
+
+    A job is a JD plus a pool of uploaded resume files, split into batches
+    (tasks). Worker processes claim pending tasks one at a time, run the
+    parse -> extract -> embed -> rank pipeline on the batch and append the
+    scored rows, so progress and partial rankings are visible while the job
+    runs. Each thread/process uses its own WAL-mode connection
+    (see cache.local_connection), so the server and workers can share the file.
+
+    A claim is a lease: tasks whose worker died or that outlive
+    JOBS_TASK_LEASE are put back in the queue by requeue_orphaned_tasks, and
+    only the current holder of a task can complete it.
+    """
+
+    def __init__(self, path=JOBS_DB_PATH, files_dir=JOBS_DIR):
+        self.path = path
+        self.files_dir = files_dir
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        os.makedirs(files_dir, exist_ok=True)
+        conn = self._connect()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                jd_text TEXT NOT NULL,
+                total INTEGER NOT NULL,
+                processed INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                created REAL NOT NULL,
+                updated REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                files TEXT NOT NULL,
+                worker_pid INTEGER,
+                claimed_at REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, id);
+            CREATE TABLE IF NOT EXISTS results (
+                job_id TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                score REAL,
+                email TEXT,
+                phone TEXT,
+                skills TEXT,
+                category TEXT,
+                category_prob REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_results_job_score ON results(job_id, score DESC);
+        """)
+
+    def _connect(self):
+        return local_connection(self._local, self.path)
+
+    def job_dir(self, job_id):
+        return os.path.join(self.files_dir, job_id)
+
+    def new_job_id(self):
+        """
+        Returns a fresh job id and creates its upload directory.
+        """
+        job_id = uuid.uuid4().hex
+        os.makedirs(self.job_dir(job_id), exist_ok=True)
+        return job_id
+
+    def create_job(self, job_id, jd_text, files, batch_size=JOBS_BATCH_SIZE):
+        """
+        Queues a job. `files` is a list of (original_filename, path) pairs
+        already stored under job_dir(job_id).
+        """
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO jobs (id, status, jd_text, total, created, updated) VALUES (?, 'queued', ?, ?, ?, ?)",
+                (job_id, jd_text, len(files), now, now),
+            )
+            for start in range(0, len(files), batch_size):
+                conn.execute(
+                    "INSERT INTO tasks (job_id, status, files) VALUES (?, 'pending', ?)",
+                    (job_id, json.dumps(files[start:start + batch_size])),
+                )
+            if not files:
+                conn.execute("UPDATE jobs SET status = 'done' WHERE id = ?", (job_id,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def claim_task(self):
+        """
+        Atomically claims the oldest pending task for this process.
+        Returns (task_id, job_id, jd_text, files) or None if the queue is empty.
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT t.id, t.job_id, j.jd_text, t.files FROM tasks t JOIN jobs j ON j.id = t.job_id "
+                "WHERE t.status = 'pending' ORDER BY t.id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = 'running', worker_pid = ?, claimed_at = ?, attempts = attempts + 1 WHERE id = ?",
+                (os.getpid(), time.time(), row[0]),
+            )
+            conn.execute("UPDATE jobs SET status = 'running', updated = ? WHERE id = ? AND status = 'queued'",
+                         (time.time(), row[1]))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return row[0], row[1], row[2], [tuple(f) for f in json.loads(row[3])]
+
+    def complete_task(self, task_id, job_id, rows, n_files, error=None, worker_pid=None):
+        """
+        Stores a batch's scored rows and advances job progress.
+        Raises TaskLost if the task is no longer held by `worker_pid` (default:
+        this process), e.g. because its lease expired and it was requeued.
+        Returns True if this was the job's last outstanding task.
+        """
+        worker_pid = os.getpid() if worker_pid is None else worker_pid
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            held = conn.execute(
+                "UPDATE tasks SET status = ?, error = ? WHERE id = ? AND status = 'running' AND worker_pid = ?",
+                ('failed' if error else 'done', error, task_id, worker_pid),
+            ).rowcount
+            if not held:
+                raise TaskLost(f"Task {task_id} of job {job_id} is no longer held by worker {worker_pid}")
+            conn.executemany(
+                "INSERT INTO results (job_id, filename, score, email, phone, skills, category, category_prob) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(job_id, r['filename'], r['score'], r['email'], r['phone'], json.dumps(r['skills']),
+                  r['category'], r['category_prob']) for r in rows],
+            )
+            conn.execute(
+                "UPDATE jobs SET processed = processed + ?, failed = failed + ?, updated = ? WHERE id = ?",
+                (n_files, n_files - len(rows), time.time(), job_id),
+            )
+            remaining = conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE job_id = ? AND status IN ('pending', 'running')", (job_id,)
+            ).fetchone()[0]
+            if remaining == 0:
+                conn.execute("UPDATE jobs SET status = 'done' WHERE id = ?", (job_id,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return remaining == 0
+
+    def requeue_orphaned_tasks(self, lease=JOBS_TASK_LEASE, max_attempts=JOBS_MAX_ATTEMPTS):
+        """
+        Puts running tasks whose worker process no longer exists, or whose lease
+        has expired, back in the queue. Tasks that already used `max_attempts`
+        claims are failed instead. Returns the number of tasks requeued or failed.
+        """
+        conn = self._connect()
+        now = time.time()
+        handled = 0
+        running = conn.execute(
+            "SELECT id, job_id, worker_pid, claimed_at, attempts, files FROM tasks WHERE status = 'running'"
+        ).fetchall()
+        for task_id, job_id, pid, claimed_at, attempts, files in running:
+            if _pid_alive(pid) and claimed_at is not None and now - claimed_at < lease:
+                continue
+            if attempts >= max_attempts:
+                files = json.loads(files)
+                error = f"Worker stopped or timed out on this batch {attempts} times"
+                try:
+                    finished = self.complete_task(task_id, job_id, [], len(files), error=error, worker_pid=pid)
+                except TaskLost:
+                    continue
+                remove_files(files)
+                if finished:
+                    shutil.rmtree(self.job_dir(job_id), ignore_errors=True)
+            else:
+                conn.execute(
+                    "UPDATE tasks SET status = 'pending', worker_pid = NULL, claimed_at = NULL "
+                    "WHERE id = ? AND status = 'running' AND worker_pid IS ?",
+                    (task_id, pid),
+                )
+            handled += 1
+        return handled
+
+    def get_job(self, job_id, limit=50):
+        """
+        Returns job status, progress and the current top `limit` results, or None.
+        """
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT status, total, processed, failed, created, updated FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        status, total, processed, failed, created, updated = row
+
+        results = [
+            {
+                'filename': r[0], 'score': r[1], 'email': r[2], 'phone': r[3],
+                'skills': json.loads(r[4]) if r[4] else [], 'category': r[5], 'category_prob': r[6],
+            }
+            for r in conn.execute(
+                "SELECT filename, score, email, phone, skills, category, category_prob FROM results "
+                "WHERE job_id = ? ORDER BY score DESC LIMIT ?", (job_id, limit)
+            )
+        ]
+        return {
+            "job_id": job_id,
+            "status": status,
+            "total": total,
+            "processed": processed,
+            "failed": failed,
+            "progress": round(100.0 * processed / total, 2) if total else 100.0,
+            "created": created,
+            "updated": updated,
+            "results": results,
+        }
+
+def remove_files(files):
+    for _, path in files:
+        if os.path.exists(path):
+            os.remove(path)
+
+def _pid_alive(pid):
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def process_batch(jd_text, files):
+    """
+    Runs the screening pipeline on one batch of (filename, path) pairs.
+    Unreadable files are skipped. Returns the scored rows.
+    """
+    resumes = []
+    for filename, path in files:
+        try:
+            text = extract_text_from_file(path)
+        except Exception as e:
+            print(f"Error processing {filename}: {e}")
+            continue
+        if not text:
+            continue
+        doc = ResumeDocument(text)
+        resumes.append({
+            'filename': filename,
+            'text': text,
+            'skills': extract_skills(doc),
+            'contact': extract_contact_info(doc),
+        })
+
+    if not resumes:
+        return []
+
+    texts = [r['text'] for r in resumes]
+    scores = score_matrix(texts, [jd_text])
+    categories = predict_category(texts)
+    return [{
+        'filename': r['filename'],
+        'score': float(scores[i, 0]),
+        'email': r['contact'].get('email'),
+        'phone': r['contact'].get('phone'),
+        'skills': r['skills'],
+        'category': categories[i][0],
+        'category_prob': categories[i][1],
+    } for i, r in enumerate(resumes)]
+
+def run_worker(store, poll_interval=1.0, stop_event=None, once=False):
+    """
+    Worker loop: claims and processes tasks until `stop_event` (anything with
+    an is_set() method) is set.
+    With once=True it returns as soon as the queue is empty.
+    Errors (including database errors while recording a failure) are logged
+    and never end the loop; an unfinished task is recovered via its lease.
+    """
+    while stop_event is None or not stop_event.is_set():
+        try:
+            task = store.claim_task()
+        except Exception as e:
+            print(f"Could not claim a task: {e}")
+            time.sleep(poll_interval)
+            continue
+
+        if task is None:
+            if once:
+                return
+            time.sleep(poll_interval)
+            continue
+
+        task_id, job_id, jd_text, files = task
+        try:
+            rows, error = process_batch(jd_text, files), None
+        except Exception as e:
+            print(f"Task {task_id} of job {job_id} failed: {e}")
+            rows, error = [], str(e)
+
+        try:
+            finished = store.complete_task(task_id, job_id, rows, len(files), error=error)
+        except TaskLost as e:
+            # Another worker owns the batch (and its files) now
+            print(f"{e}; discarding its results")
+            continue
+        except Exception as e:
+            # Leave the task running; requeue_orphaned_tasks retries it once the lease expires
+            print(f"Could not record task {task_id} of job {job_id}: {e}")
+            continue
+
+        # Uploaded files are only needed until their batch is scored
+        remove_files(files)
+        if finished:
+            shutil.rmtree(store.job_dir(job_id), ignore_errors=True)
@@ -1,6 +1,35 @@
 import os
 from pdfminer.high_level import extract_text
 import docx
+from src.cache import ParseCache, content_key, CACHE_ENABLED
+
+# Only formats that need a real parser are cached; plain text is read directly.
+CACHED_FORMATS = ('.pdf', '.docx')
+
+# Global parse cache, created on first use
+parse_cache = None
+
+def get_parse_cache():
+    """
+    Returns the shared parsed-text cache, or None if caching is disabled
+    or the cache could not be opened.
+    """
+    global parse_cache
+
+    if parse_cache is None and CACHE_ENABLED:
+        try:
+            parse_cache = ParseCache()
+        except Exception as e:
+            print(f"Parse cache unavailable: {e}")
+            return None
+    return parse_cache
+
+def set_parse_cache(cache):
+    """
+    Replaces the shared parse cache, e.g. to point it at another database.
+    """
+    global parse_cache
+    parse_cache = cache
 
 def extract_text_from_pdf(file_path):
     """
@@ -27,15 +56,40 @@ def extract_text_from_docx(file_path):
         print(f"Error reading DOCX {file_path}: {e}")
         return ""
 
-def extract_text_from_file(file_path):
+def extract_text_from_file(file_path, use_cache=True):
     """
     Dispatcher function to extract text based on file extension.
+    PDF and DOCX results are cached by content hash, so re-uploads of the
+    same file skip parsing.
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
     ext = os.path.splitext(file_path)[1].lower()
-    
+
+    cache = get_parse_cache() if use_cache and ext in CACHED_FORMATS else None
+    if cache is not None:
+        with open(file_path, 'rb') as f:
+            key = content_key(f.read(), namespace=ext)
+        try:
+            text = cache.get(key)
+        except Exception as e:
+            print(f"Parse cache read failed: {e}")
+            text = None
+        if text is not None:
+            return text
+
+        text = _parse_file(file_path, ext)
+        if text:
+            try:
+                cache.put(key, text)
+            except Exception as e:
+                print(f"Parse cache write failed: {e}")
+        return text
+
+    return _parse_file(file_path, ext)
+
+def _parse_file(file_path, ext):
     if ext == '.pdf':
         return extract_text_from_pdf(file_path)
     elif ext == '.docx':
@@ -0,0 +1,239 @@
+import os
+import re
+import csv
+import glob
+import heapq
+import itertools
+
+RESULT_COLUMNS = ['filename', 'score', 'email', 'phone', 'skills', 'category', 'category_prob']
+SKILL_SEPARATOR = ', '
+
+# Files a Parquet results directory may contain (parts plus leftovers of interrupted writes)
+PART_FILE_PATTERN = re.compile(r'^part-\d+\.parquet(\.tmp)?$')
+
+def _parquet_schema():
+    import pyarrow as pa
+    return pa.schema([
+        ('filename', pa.string()),
+        ('score', pa.float64()),
+        ('email', pa.string()),
+        ('phone', pa.string()),
+        ('skills', pa.list_(pa.string())),
+        ('category', pa.string()),
+        ('category_prob', pa.float64()),
+    ])
+
+def _normalize(row):
+    skills = row.get('skills') or []
+    if isinstance(skills, str):
+        skills = [s for s in skills.split(SKILL_SEPARATOR) if s]
+    return {
+        'filename': row['filename'],
+        'score': float(row['score']) if row.get('score') not in (None, '') else None,
+        'email': row.get('email') or None,
+        'phone': row.get('phone') or None,
+        'skills': list(skills),
+        'category': row.get('category') or None,
+        'category_prob': float(row['category_prob']) if row.get('category_prob') not in (None, '') else None,
+    }
+
+class ResultsWriter:
+    """
+    Streams screening results to disk in chunks while a run is in progress.
+
+    - CSV (default): rows are appended and fsynced every `chunk_size` rows.
+      Skills are stored as a comma-separated string.
+    - Parquet (path ends in .parquet): the path is a directory of part files,
+      one per chunk (row group), with skills as list<string>. Each part is
+      written atomically so a crash never leaves an unreadable file.
+
+    Rows with an empty score record resumes that yielded no text, so they are
+    not retried on resume.
+
+    With resume=True, rows already on disk are kept and new rows are appended
+    after them. The existing rows are streamed once: their filenames go into
+    `completed` and, if `top` (a TopResults) is given, they seed it. An
+    unterminated last CSV line left by a crash is dropped first.
+    Otherwise the previous output is replaced. A path that is not a results
+    file/directory this writer could have produced, or existing output with
+    other columns, raises ValueError.
+    """
+
+    def __init__(self, path, chunk_size=500, resume=False, top=None):
+        self.path = path
+        self.format = 'parquet' if path.lower().endswith('.parquet') else 'csv'
+        self.chunk_size = chunk_size
+        self._buffer = []
+        self.completed = set()
+
+        if self.format == 'csv' and os.path.isdir(path):
+            raise ValueError(f"Output path is a directory, expected a CSV file: {path}")
+        if self.format == 'parquet' and os.path.exists(path) and not _is_parts_dir(path):
+            raise ValueError(f"Output path exists and is not a Parquet results directory: {path}")
+
+        if resume and os.path.exists(path):
+            self._check_columns()
+            if self.format == 'csv':
+                self._drop_partial_line()
+            for row in iter_results(path):
+                self.completed.add(row['filename'])
+                if top is not None:
+                    top.add([row])
+        elif self.format == 'parquet' and os.path.isdir(path):
+            for name in os.listdir(path):
+                os.remove(os.path.join(path, name))
+        elif os.path.exists(path):
+            os.remove(path)
+
+        self._part = len(glob.glob(os.path.join(path, "part-*.parquet"))) if self.format == 'parquet' else 0
+
+    def _check_columns(self):
+        # Appending to output with another layout (e.g. an older results.csv) would corrupt it
+        if self.format == 'parquet':
+            import pyarrow.parquet as pq
+            parts = sorted(glob.glob(os.path.join(self.path, "part-*.parquet")))
+            columns = pq.read_schema(parts[0]).names if parts else RESULT_COLUMNS
+        else:
+            with open(self.path, 'r', newline='', encoding='utf-8') as f:
+                columns = next(csv.reader(f), RESULT_COLUMNS)
+        if list(columns) != RESULT_COLUMNS:
+            raise ValueError(f"Cannot resume {self.path}: its columns {list(columns)} "
+                             f"do not match {RESULT_COLUMNS}")
+
+    def _drop_partial_line(self):
+        # A crash mid-flush can leave an unterminated last row; it is dropped
+        # (and re-scored) so new rows start on a fresh line.
+        with open(self.path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            while pos > 0:
+                start = max(0, pos - 65536)
+                f.seek(start)
+                newline = f.read(pos - start).rfind(b'\n')
+                if newline != -1:
+                    pos = start + newline + 1
+                    break
+                pos = start
+            if pos < end:
+                f.truncate(pos)
+
+    def write(self, rows):
+        """
+        Buffers rows and flushes every `chunk_size` rows.
+        """
+        for row in rows:
+            self._buffer.append(_normalize(row))
+            if len(self._buffer) >= self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        if self.format == 'parquet':
+            self._flush_parquet()
+        else:
+            self._flush_csv()
+        self.completed.update(row['filename'] for row in self._buffer)
+        self._buffer = []
+
+    def _flush_csv(self):
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        with open(self.path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+            if new_file:
+                writer.writeheader()
+            for row in self._buffer:
+                writer.writerow(dict(row, skills=SKILL_SEPARATOR.join(row['skills'])))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _flush_parquet(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        os.makedirs(self.path, exist_ok=True)
+        table = pa.Table.from_pylist(self._buffer, schema=_parquet_schema())
+        final = os.path.join(self.path, f"part-{self._part:05d}.parquet")
+        tmp = final + ".tmp"
+        pq.write_table(table, tmp)
+        os.replace(tmp, final)
+        self._part += 1
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _is_parts_dir(path):
+    return os.path.isdir(path) and all(PART_FILE_PATTERN.match(name) for name in os.listdir(path))
+
+def iter_results(path):
+    """
+    Streams results written by ResultsWriter back as dicts (skills as lists),
+    one Parquet part or CSV row at a time. The file is only read.
+    """
+    if path.lower().endswith('.parquet'):
+        import pyarrow.parquet as pq
+        for part in sorted(glob.glob(os.path.join(path, "part-*.parquet"))):
+            for row in pq.read_table(part).to_pylist():
+                yield _normalize(row)
+        return
+
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield _normalize(row)
+
+def write_table(rows, columns, path):
+    """
+    Writes a finished table of result rows (e.g. multi-JD shortlists) in one go.
+    A path ending in .parquet gets a single Parquet file, with skills as
+    list<string> like ResultsWriter's parts; otherwise a CSV is written with
+    skills comma-separated.
+    """
+    if path.lower().endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        base = _parquet_schema()
+        types = dict(zip(base.names, base.types), jd=pa.string(), rank=pa.int64())
+        schema = pa.schema([(c, types[c]) for c in columns])
+        pq.write_table(pa.Table.from_pylist([{c: row.get(c) for c in columns} for row in rows], schema=schema), path)
+        return
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(dict(row, skills=SKILL_SEPARATOR.join(row.get('skills') or [])))
+
+def read_results(path):
+    """
+    Reads all results written by ResultsWriter into a list. See iter_results.
+    """
+    return list(iter_results(path))
+
+class TopResults:
+    """
+    Keeps the N best-scoring rows seen so far without holding the full result set.
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self._heap = []
+        self._counter = itertools.count()
+
+    def add(self, rows):
+        for row in rows:
+            if row['score'] is None:
+                continue
+            item = (row['score'], next(self._counter), row)
+            if len(self._heap) < self.n:
+                heapq.heappush(self._heap, item)
+            elif item[0] > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+
+    def sorted(self):
+        return [row for _, _, row in sorted(self._heap, key=lambda x: (-x[0], x[1]))]
@@ -1,5 +1,8 @@
 from sentence_transformers import SentenceTransformer, util
+import numpy as np
 import logging
+import re
+import zlib
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -14,6 +17,33 @@ except Exception as e:
     logger.error(f"Failed to load SBERT model: {e}")
     model = None
 
+class HashingEmbedder:
+    """
+    Deterministic bag-of-words embedder for the benchmark and tests when SBERT
+    weights are not available. Mirrors the subset of SentenceTransformer.encode
+    used by the screener. Never loaded automatically.
+    """
+    dim = 384
+
+    def encode(self, sentences, convert_to_tensor=False, **kwargs):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+
+        out = np.zeros((len(sentences), self.dim), dtype=np.float32)
+        for i, sentence in enumerate(sentences):
+            for token in re.findall(r'\w+', sentence.lower()):
+                out[i, zlib.crc32(token.encode('utf-8')) % self.dim] += 1.0
+
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        out /= norms
+
+        if convert_to_tensor:
+            import torch
+            out = torch.from_numpy(out)
+        return out[0] if single else out
+
 def calculate_similarity(resume_text, job_description):
     """
     Calculates the semantic similarity between the resume text and the job description
@@ -38,22 +68,85 @@ def calculate_similarity(resume_text, job_description):
     
     return match_percentage
 
+def embed_texts(texts, batch_size=32):
+    """
+    Encodes a list of texts in batches. Returns a tensor of shape (len(texts), dim).
+    """
+    return model.encode(texts, batch_size=batch_size, convert_to_tensor=True)
+
+def score_matrix(resume_texts, job_descriptions):
+    """
+    Scores every resume against every job description in one matrix product.
+    Each text is embedded exactly once.
+    Returns a numpy array of shape (n_resumes, n_jds) with percentages 0-100.
+    """
+    if not model:
+        logger.warning("Model not loaded, returning 0 scores.")
+        return np.zeros((len(resume_texts), len(job_descriptions)))
+    if not resume_texts or not job_descriptions:
+        return np.zeros((len(resume_texts), len(job_descriptions)))
+
+    resume_embeddings = embed_texts(resume_texts)
+    jd_embeddings = embed_texts(job_descriptions)
+
+    scores = util.cos_sim(resume_embeddings, jd_embeddings)
+    return np.round(scores.cpu().numpy().astype(float) * 100, 2)
+
+def _result_row(resume, score):
+    return {
+        'filename': resume['filename'],
+        'score': score,
+        'email': resume.get('contact', {}).get('email'),
+        'phone': resume.get('contact', {}).get('phone'),
+        'skills': list(resume.get('skills', [])),
+        'category': resume.get('category')
+    }
+
 def rank_resumes(resumes_data, job_description):
     """
     Ranks resumes based on semantic similarity to job description.
     resumes_data: List of dicts {'filename': str, 'text': str, 'skills': list}
     """
-    ranked_resumes = []
-    
-    for resume in resumes_data:
-        score = calculate_similarity(resume['text'], job_description)
-        ranked_resumes.append({
-            'filename': resume['filename'],
-            'score': score,
-            'email': resume.get('contact', {}).get('email'),
-            'phone': resume.get('contact', {}).get('phone'),
-            'skills': ', '.join(resume.get('skills', []))
-        })
-    
+    scores = score_matrix([r['text'] for r in resumes_data], [job_description])
+
+    ranked_resumes = [
+        dict(_result_row(resume, float(scores[i, 0])), skills=', '.join(resume.get('skills', [])))
+        for i, resume in enumerate(resumes_data)
+    ]
     ranked_resumes.sort(key=lambda x: x['score'], reverse=True)
     return ranked_resumes
+
+def rank_against_jobs(resumes_data, job_descriptions, top_k=None):
+    """
+    Screens a resume pool against many job descriptions at once.
+    job_descriptions: Dict {jd_name: jd_text}
+    Returns (shortlists, best_fit):
+      shortlists: {jd_name: ranked list of result dicts (top_k per JD if given)}
+      best_fit: one result dict per resume with its best matching 'jd' and score
+    Raises ValueError if top_k is given and less than 1.
+    """
+    if top_k is not None and top_k < 1:
+        raise ValueError("top_k must be at least 1")
+
+    jd_names = list(job_descriptions)
+    scores = score_matrix([r['text'] for r in resumes_data], [job_descriptions[n] for n in jd_names])
+
+    shortlists = {}
+    for j, jd_name in enumerate(jd_names):
+        order = np.argsort(-scores[:, j], kind='stable')
+        if top_k is not None:
+            order = order[:top_k]
+        shortlists[jd_name] = [
+            dict(_result_row(resumes_data[i], float(scores[i, j])), jd=jd_name, rank=rank)
+            for rank, i in enumerate(order, start=1)
+        ]
+
+    best_fit = []
+    for i, resume in enumerate(resumes_data):
+        if not jd_names:
+            break
+        j = int(np.argmax(scores[i]))
+        best_fit.append(dict(_result_row(resume, float(scores[i, j])), jd=jd_names[j]))
+    best_fit.sort(key=lambda x: x['score'], reverse=True)
+
+    return shortlists, best_fit
@@ -0,0 +1,73 @@
+import gc
+import time
+from src import extractor, screener
+from src.extractor import ResumeDocument, extract_skills, extract_contact_info
+from src.classifier import load_category_model, predict_categories
+
+# Warm-up state. Under gunicorn (see gunicorn.conf.py) and worker.py warm-up runs
+# once in the parent process, so forked workers start with this already set.
+warmup_state = {"ready": False, "seconds": None, "models": {}}
+
+WARMUP_TEXT = (
+    "Jane Doe - jane.doe@example.com - (555) 123-4567\n"
+    "Python developer with experience in machine learning, NLP, SQL and Docker."
+)
+
+def set_torch_threads(n):
+    """
+    Sets torch's intra-op thread count; a no-op if torch is not installed.
+    """
+    try:
+        import torch
+        torch.set_num_threads(n)
+    except Exception:
+        pass
+
+def warm_up():
+    """
+    Loads every model and runs one inference through each so the first real
+    request doesn't pay for lazy loading. Missing models are reported, not fatal.
+    """
+    if warmup_state["ready"]:
+        return warmup_state
+
+    start = time.perf_counter()
+    models = {}
+
+    try:
+        doc = ResumeDocument(WARMUP_TEXT)
+        extract_skills(doc)
+        extract_contact_info(doc)
+        models["bert"] = extractor.bert_nlp is not None
+        models["skill_classifier"] = extractor.clf is not None
+    except Exception as e:
+        print(f"Warm-up skill extraction failed: {e}")
+
+    try:
+        screener.score_matrix([WARMUP_TEXT], [WARMUP_TEXT])
+        models["sbert"] = screener.model is not None
+    except Exception as e:
+        print(f"Warm-up scoring failed: {e}")
+
+    try:
+        models["category_classifier"] = load_category_model()
+        predict_categories([WARMUP_TEXT])
+    except Exception as e:
+        print(f"Warm-up classification failed: {e}")
+
+    warmup_state.update(ready=True, seconds=round(time.perf_counter() - start, 3), models=models)
+    print(f"Warm-up finished in {warmup_state['seconds']}s: {models}")
+    return warmup_state
+
+def warm_up_before_fork():
+    """
+    Warms up in a parent process that is about to fork workers (gunicorn with
+    preload_app, worker.py), so the models live in copy-on-write pages shared
+    by every worker instead of one copy each. Torch runs single-threaded here
+    so no OpenMP thread pool exists at fork time, and the GC is frozen so the
+    first collection in each worker doesn't touch (and un-share) those pages.
+    """
+    set_torch_threads(1)
+    state = warm_up()
+    gc.freeze()
+    return state
@@ -0,0 +1,8 @@
+import pytest
+from src import parser as parser_module
+from src.cache import ParseCache
+
+@pytest.fixture(autouse=True)
+def isolated_parse_cache(tmp_path, monkeypatch):
+    # Keep tests from creating or filling ./.cache in the working tree
+    monkeypatch.setattr(parser_module, "parse_cache", ParseCache(str(tmp_path / "parse_cache.sqlite")))
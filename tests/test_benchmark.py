@@ -0,0 +1,22 @@
+import os
+from benchmark import generate_corpus
+from src.screener import HashingEmbedder
+from src.parser import extract_text_from_file
+
+def test_generate_corpus_is_reproducible(tmp_path):
+    a = generate_corpus(str(tmp_path / "a"), size=3, length=2, formats=('txt', 'docx'), seed=7)
+    b = generate_corpus(str(tmp_path / "b"), size=3, length=2, formats=('txt',), seed=7)
+
+    assert len(a['txt']) == 3 and len(a['docx']) == 3
+    assert os.path.exists(tmp_path / "a" / "jd.txt")
+    for pa, pb in zip(a['txt'], b['txt']):
+        assert extract_text_from_file(pa) == extract_text_from_file(pb)
+
+    # DOCX carries the same content as the TXT version
+    assert "Experience" in extract_text_from_file(a['docx'][0])
+
+def test_hashing_embedder_similarity():
+    emb = HashingEmbedder().encode(["python developer", "python developer", "chef cooking food"])
+    assert emb.shape == (3, HashingEmbedder.dim)
+    assert abs(float(emb[0] @ emb[1]) - 1.0) < 1e-6
+    assert float(emb[0] @ emb[2]) < 0.5
@@ -0,0 +1,59 @@
+import pytest
+from src.cache import ParseCache, content_key
+from src import parser as parser_module
+
+def test_cache_roundtrip(tmp_path):
+    cache = ParseCache(str(tmp_path / "c.sqlite"))
+    key = content_key(b"%PDF-1.4 fake", namespace=".pdf")
+    assert cache.get(key) is None
+    cache.put(key, "Python developer")
+    assert cache.get(key) == "Python developer"
+    assert key != content_key(b"%PDF-1.4 fake", namespace=".docx")
+
+@pytest.mark.parametrize("eviction, survivor", [("lru", "a"), ("fifo", "c")])
+def test_cache_eviction(tmp_path, eviction, survivor):
+    # Random entries of about equal size; only two fit
+    import os, zlib
+    entries = {k: os.urandom(512).hex() for k in "abc"}
+    size = len(zlib.compress(entries["a"].encode("utf-8")))
+    cache = ParseCache(str(tmp_path / "c.sqlite"), max_bytes=2 * size + size // 2, eviction=eviction)
+    cache.put("a", entries["a"])
+    cache.put("b", entries["b"])
+    cache.get("a")  # refreshes "a" under LRU only
+    cache.put("c", entries["c"])
+
+    assert cache.stats()["entries"] == 2
+    assert cache.get(survivor) is not None
+    assert cache.get("b" if eviction == "lru" else "a") is None
+
+def test_cache_tracks_total_bytes(tmp_path):
+    import os, sqlite3
+    path = str(tmp_path / "c.sqlite")
+    cache = ParseCache(path, max_bytes=20_000)
+    for i in range(60):
+        cache.put(str(i), os.urandom(300).hex())
+    cache.put("59", "replaced")
+
+    actual = sqlite3.connect(path).execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    assert cache.stats()["bytes"] == actual <= 20_000
+    cache.clear()
+    assert cache.stats() == {"entries": 0, "bytes": 0, "max_bytes": 20_000, "eviction": "lru"}
+
+def test_unknown_eviction_policy(tmp_path):
+    with pytest.raises(ValueError):
+        ParseCache(str(tmp_path / "c.sqlite"), eviction="random")
+
+def test_repeat_parse_hits_cache(tmp_path, monkeypatch):
+    import docx
+    path = tmp_path / "cv.docx"
+    doc = docx.Document()
+    doc.add_paragraph("Senior Python Engineer")
+    doc.save(str(path))
+
+    monkeypatch.setattr(parser_module, "parse_cache", ParseCache(str(tmp_path / "c.sqlite")))
+    assert "Senior Python Engineer" in parser_module.extract_text_from_file(str(path))
+
+    def fail(*args):
+        raise AssertionError("parser should not run on a cache hit")
+    monkeypatch.setattr(parser_module, "extract_text_from_docx", fail)
+    assert "Senior Python Engineer" in parser_module.extract_text_from_file(str(path))
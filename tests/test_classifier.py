@@ -0,0 +1,54 @@
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder
+from src import classifier
+
+def _train_tiny_model():
+    texts = [
+        "python machine learning pandas numpy", "deep learning pytorch data science",
+        "java spring backend microservices", "java hibernate rest api backend",
+        "sales targets clients negotiation", "account management sales pipeline",
+    ]
+    labels = ["Data Science", "Data Science", "Java Developer", "Java Developer", "Sales", "Sales"]
+    le = LabelEncoder()
+    y = le.fit_transform(labels)
+    pipeline = Pipeline([('tfidf', TfidfVectorizer()), ('clf', MultinomialNB())])
+    pipeline.fit([classifier.clean_resume(t) for t in texts], y)
+    return pipeline, le
+
+def test_predict_categories_batch(monkeypatch):
+    pipeline, le = _train_tiny_model()
+    monkeypatch.setattr(classifier, "category_model", pipeline)
+    monkeypatch.setattr(classifier, "category_encoder", le)
+
+    calls = []
+    transform = pipeline.named_steps['tfidf'].transform
+    monkeypatch.setattr(pipeline.named_steps['tfidf'], "transform", lambda X: calls.append(len(X)) or transform(X))
+
+    texts = ["Python, NumPy and machine learning!", "Java backend REST developer", "Closing sales with clients"]
+    preds = classifier.predict_categories(texts, top_k=2)
+
+    assert calls == [3]  # one vectorize call for the whole batch
+    assert [p[0][0] for p in preds] == ["Data Science", "Java Developer", "Sales"]
+    assert all(len(p) == 2 and p[0][1] >= p[1][1] for p in preds)
+
+def test_predict_category_without_model(monkeypatch):
+    monkeypatch.setattr(classifier, "category_model", None)
+    monkeypatch.setattr(classifier, "MODEL_PATH", "missing/category_model.pkl")
+    assert classifier.predict_category(["anything"]) == [("Unknown", 0.0)]
+    assert classifier.predict_categories([]) == []
+
+def test_predict_categories_rejects_bad_top_k():
+    import pytest
+    for top_k in (0, -1):
+        with pytest.raises(ValueError):
+            classifier.predict_categories(["anything"], top_k=top_k)
+
+def test_classify_endpoint_rejects_bad_top_k():
+    from fastapi.testclient import TestClient
+    import server
+    client = TestClient(server.app)
+    for top_k in (0, -1):
+        resp = client.post("/classify", files=[("resumes", ("a.txt", b"Python", "text/plain"))], data={"top_k": top_k})
+        assert resp.status_code == 400
@@ -20,3 +20,21 @@ def test_extract_contact_info():
     info = extract_contact_info(text)
     assert info['email'] == "test@example.com"
     assert info['phone'] == "(123) 456-7890"
+
+def test_combined_skill_pattern_matches_per_skill_search():
+    import re
+    from src.extractor import SKILLS_PATTERN, COMMON_SKILLS
+    text = "Java and JavaScript, Node.js on AWS; scikit-learn, Machine Learning. C++ dev"
+    expected = {s for s in COMMON_SKILLS if re.search(r'\b' + re.escape(s) + r'\b', text, re.IGNORECASE)}
+    assert {m.group(0) for m in SKILLS_PATTERN.finditer(text.lower())} == expected
+
+def test_resume_document_shared_across_extractors():
+    from src.extractor import ResumeDocument
+    doc = ResumeDocument("Jane Doe jane@example.com +1 555-123-4567 Python SQL")
+    assert "python" in extract_skills(doc)
+    info = extract_contact_info(doc)
+    assert info['email'] == "jane@example.com"
+    assert info['phone'] == "+1 555-123-4567"
+    # Derived forms are computed once and cached on the document
+    assert doc.tokens is doc.tokens
+    assert doc.lower == doc.text.lower()
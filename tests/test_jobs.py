@@ -0,0 +1,109 @@
+import os
+import pytest
+from fastapi.testclient import TestClient
+import server
+from src import jobs, screener
+from src.jobs import JobStore, TaskLost, run_worker
+from src.screener import HashingEmbedder
+
+def _submit(client, resumes, batch_size):
+    files = [("resumes", (name, text.encode("utf-8"), "text/plain")) for name, text in resumes]
+    resp = client.post("/jobs", files=files, data={"job_description": "Python developer with SQL", "batch_size": batch_size})
+    assert resp.status_code == 202
+    return resp.json()["job_id"]
+
+def test_job_lifecycle(tmp_path, monkeypatch):
+    store = JobStore(str(tmp_path / "jobs.sqlite"), str(tmp_path / "files"))
+    monkeypatch.setattr(server, "job_store", store)
+    monkeypatch.setattr(screener, "model", HashingEmbedder())
+    client = TestClient(server.app)
+
+    resumes = [
+        ("dev.txt", "Python developer, SQL. dev@example.com"),
+        ("chef.txt", "Chef cooking food"),
+        ("empty.txt", ""),
+    ]
+    job_id = _submit(client, resumes, batch_size=2)
+
+    job = client.get(f"/jobs/{job_id}").json()
+    assert job["status"] == "queued" and job["total"] == 3 and job["processed"] == 0
+
+    # One batch -> partial results are visible
+    task_id, _, jd_text, files = store.claim_task()
+    store.complete_task(task_id, job_id, jobs.process_batch(jd_text, files), len(files))
+    job = client.get(f"/jobs/{job_id}").json()
+    assert job["status"] == "running" and job["processed"] == 2
+    assert [r["filename"] for r in job["results"]] == ["dev.txt", "chef.txt"]
+    assert job["results"][0]["email"] == "dev@example.com"
+
+    run_worker(store, once=True)
+    job = store.get_job(job_id)
+    assert job["status"] == "done" and job["processed"] == 3 and job["failed"] == 1
+    assert not (tmp_path / "files" / job_id).exists()
+
+def test_unknown_job_and_orphaned_tasks(tmp_path, monkeypatch):
+    store = JobStore(str(tmp_path / "jobs.sqlite"), str(tmp_path / "files"))
+    monkeypatch.setattr(server, "job_store", store)
+    client = TestClient(server.app)
+    assert client.get("/jobs/nope").status_code == 404
+    assert client.get("/jobs/nope?limit=-1").status_code == 422
+    assert client.get("/jobs/nope?limit=100000").status_code == 422
+
+    job_id = store.new_job_id()
+    store.create_job(job_id, "JD", [("a.txt", str(tmp_path / "a.txt"))])
+    task = store.claim_task()
+    assert task is not None and store.claim_task() is None
+
+    # Pretend the claiming worker died
+    store._connect().execute("UPDATE tasks SET worker_pid = ?", (2 ** 22 + 1,))
+    assert store.requeue_orphaned_tasks() == 1
+    assert store.claim_task()[0] == task[0]
+
+def test_expired_leases_and_attempt_limit(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite"), str(tmp_path / "files"))
+    upload = tmp_path / "a.txt"
+    upload.write_text("Python")
+    job_id = store.new_job_id()
+    store.create_job(job_id, "JD", [("a.txt", str(upload))])
+
+    # A live but stuck worker keeps its task until the lease runs out
+    task_id = store.claim_task()[0]
+    assert store.requeue_orphaned_tasks(lease=3600) == 0
+    assert store.requeue_orphaned_tasks(lease=0) == 1
+
+    # The stuck worker finishing late must not double-count the batch
+    with pytest.raises(TaskLost):
+        store.complete_task(task_id, job_id, [], 1, worker_pid=os.getpid())
+    assert store.get_job(job_id)["processed"] == 0
+
+    # Out of attempts: the batch is failed and the job still finishes
+    assert store.claim_task()[0] == task_id
+    assert store.requeue_orphaned_tasks(lease=0, max_attempts=2) == 1
+    job = store.get_job(job_id)
+    assert job["status"] == "done" and job["processed"] == 1 and job["failed"] == 1
+    assert not upload.exists()
+
+def test_worker_survives_database_errors(tmp_path, monkeypatch):
+    store = JobStore(str(tmp_path / "jobs.sqlite"), str(tmp_path / "files"))
+    monkeypatch.setattr(screener, "model", HashingEmbedder())
+    job_id = store.new_job_id()
+    store.create_job(job_id, "JD", [("a.txt", str(tmp_path / "missing.txt"))])
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("database is locked")
+    monkeypatch.setattr(store, "complete_task", broken)
+    run_worker(store, once=True)  # must not raise
+    assert store.get_job(job_id)["status"] == "running"
+
+def test_stop_signal_ends_worker_loop(tmp_path):
+    import signal
+    import worker
+    store = JobStore(str(tmp_path / "jobs.sqlite"), str(tmp_path / "files"))
+    stop = worker.StopFlag()
+    previous = signal.signal(signal.SIGUSR1, stop.set)
+    try:
+        os.kill(os.getpid(), signal.SIGUSR1)
+        run_worker(store, poll_interval=0.01, stop_event=stop)  # returns instead of polling forever
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+    assert stop.is_set()
@@ -0,0 +1,116 @@
+import pytest
+from src.results import ResultsWriter, TopResults, read_results, write_table
+
+ROWS = [
+    {'filename': f'cv_{i}.pdf', 'score': float(i), 'email': f'c{i}@example.com', 'phone': None, 'skills': ['python', 'sql']}
+    for i in range(7)
+]
+
+def test_csv_writer_flushes_in_chunks(tmp_path):
+    path = str(tmp_path / "results.csv")
+    writer = ResultsWriter(path, chunk_size=3)
+    writer.write(ROWS)
+    # Two full chunks are on disk before close
+    assert len(read_results(path)) == 6
+    writer.close()
+
+    rows = read_results(path)
+    assert [r['filename'] for r in rows] == [r['filename'] for r in ROWS]
+    assert rows[0]['skills'] == ['python', 'sql']
+    assert rows[0]['phone'] is None
+
+def test_csv_resume_discards_partial_line(tmp_path):
+    path = tmp_path / "results.csv"
+    with ResultsWriter(str(path), chunk_size=2) as writer:
+        writer.write(ROWS[:3])
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("cv_9.pdf,4")  # interrupted mid-row
+
+    with ResultsWriter(str(path), resume=True) as writer:
+        assert writer.completed == {'cv_0.pdf', 'cv_1.pdf', 'cv_2.pdf'}
+        writer.write(ROWS[3:])
+    assert len(read_results(str(path))) == 7
+
+    # Without resume the file starts over
+    with ResultsWriter(str(path)) as writer:
+        assert not writer.completed
+
+def test_resume_rejects_other_columns_and_reading_never_edits(tmp_path):
+    # Header of results.csv files written before category columns existed
+    path = tmp_path / "results.csv"
+    path.write_text("filename,score,email,phone,skills\ncv_0.pdf,50.0,,,python", encoding='utf-8')
+    before = path.read_bytes()
+
+    # A last row without a newline is still a row, and reading leaves the file alone
+    assert [r['filename'] for r in read_results(str(path))] == ['cv_0.pdf']
+    assert path.read_bytes() == before
+
+    with pytest.raises(ValueError):
+        ResultsWriter(str(path), resume=True)
+    assert path.read_bytes() == before
+
+def test_parquet_writer_typed_columns(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "results.parquet")
+    with ResultsWriter(path, chunk_size=4) as writer:
+        writer.write(ROWS)
+
+    table = pq.read_table(path)
+    assert table.num_rows == 7
+    assert str(table.schema.field('skills').type) == 'list<element: string>'
+    assert ResultsWriter(path, resume=True).completed == {r['filename'] for r in ROWS}
+
+def test_top_results_keeps_best():
+    top = TopResults(3)
+    top.add(ROWS)
+    assert [r['score'] for r in top.sorted()] == [6.0, 5.0, 4.0]
+
+def test_resume_seeds_top_and_records_unreadable(tmp_path):
+    path = str(tmp_path / "results.csv")
+    with ResultsWriter(path, chunk_size=2) as writer:
+        writer.write(ROWS[:3] + [{'filename': 'scan.pdf', 'score': None}])
+
+    top = TopResults(2)
+    writer = ResultsWriter(path, resume=True, top=top)
+    assert 'scan.pdf' in writer.completed
+    assert [r['filename'] for r in top.sorted()] == ['cv_2.pdf', 'cv_1.pdf']
+    assert not hasattr(writer, 'existing')
+
+def test_refuses_to_replace_foreign_directories(tmp_path):
+    victim = tmp_path / "victim"
+    victim.mkdir()
+    (victim / "keep.txt").write_text("important")
+    with pytest.raises(ValueError):
+        ResultsWriter(str(victim))
+
+    foreign = tmp_path / "other.parquet"
+    foreign.mkdir()
+    (foreign / "keep.txt").write_text("important")
+    with pytest.raises(ValueError):
+        ResultsWriter(str(foreign))
+    assert (victim / "keep.txt").exists() and (foreign / "keep.txt").exists()
+
+def test_parquet_rerun_replaces_parts(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "results.parquet")
+    with ResultsWriter(path, chunk_size=2) as writer:
+        writer.write(ROWS)
+    with ResultsWriter(path) as writer:
+        writer.write(ROWS[:1])
+    assert [r['filename'] for r in read_results(path)] == ['cv_0.pdf']
+
+def test_write_table_types_skills(tmp_path):
+    import pyarrow.parquet as pq
+    rows = [dict(ROWS[0], jd='dev.txt', rank=1), dict(ROWS[1], jd='dev.txt', rank=2, skills=[])]
+    columns = ['jd', 'rank', 'filename', 'score', 'skills']
+
+    write_table(rows, columns, str(tmp_path / "shortlists.parquet"))
+    table = pq.read_table(str(tmp_path / "shortlists.parquet"))
+    import pyarrow as pa
+    assert pa.types.is_list(table.schema.field('skills').type)
+    assert table.column('skills').to_pylist() == [['python', 'sql'], []]
+
+    write_table(rows, columns, str(tmp_path / "shortlists.csv"))
+    lines = (tmp_path / "shortlists.csv").read_text().splitlines()
+    assert lines[0] == 'jd,rank,filename,score,skills'
+    assert lines[1] == 'dev.txt,1,cv_0.pdf,0.0,"python, sql"'
@@ -1,3 +1,4 @@
+import pytest
 from src.screener import calculate_similarity
 
 def test_calculate_similarity_exact_match():
@@ -12,3 +13,26 @@ def test_calculate_similarity_no_match():
     score = calculate_similarity(text1, text2)
     # Score should be very low
     assert score < 20.0
+
+def test_rank_against_jobs_matrix(monkeypatch):
+    from src import screener
+    from src.screener import HashingEmbedder
+    monkeypatch.setattr(screener, "model", HashingEmbedder())
+
+    resumes = [
+        {'filename': 'dev.txt', 'text': 'Python developer machine learning', 'skills': ['python']},
+        {'filename': 'cook.txt', 'text': 'Chef cooking food in a kitchen', 'skills': []},
+    ]
+    jds = {'python_dev': 'Python developer with machine learning', 'chef': 'Chef cooking food'}
+
+    scores = screener.score_matrix([r['text'] for r in resumes], list(jds.values()))
+    assert scores.shape == (2, 2)
+
+    shortlists, best_fit = screener.rank_against_jobs(resumes, jds, top_k=1)
+    assert [r['filename'] for r in shortlists['python_dev']] == ['dev.txt']
+    assert [r['filename'] for r in shortlists['chef']] == ['cook.txt']
+    assert {r['filename']: r['jd'] for r in best_fit} == {'dev.txt': 'python_dev', 'cook.txt': 'chef'}
+
+    for top_k in (0, -1):
+        with pytest.raises(ValueError):
+            screener.rank_against_jobs(resumes, jds, top_k=top_k)
@@ -0,0 +1,17 @@
+from fastapi.testclient import TestClient
+import server
+from src import warmup
+
+def test_readiness_waits_for_warm_up(monkeypatch):
+    monkeypatch.setitem(warmup.warmup_state, "ready", False)
+    client = TestClient(server.app)
+
+    # Liveness never depends on warm-up
+    assert client.get("/healthz").status_code == 200
+    assert client.get("/readyz").status_code == 503
+
+    # Entering the client runs the app lifespan, which warms up
+    with TestClient(server.app) as client:
+        resp = client.get("/readyz")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "ready"
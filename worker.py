@@ -0,0 +1,100 @@
+import os
+import time
+import signal
+import argparse
+import multiprocessing
+from multiprocessing.connection import wait
+
+from src.jobs import JobStore, run_worker, JOBS_DB_PATH, JOBS_DIR
+from src.warmup import warm_up_before_fork, set_torch_threads
+
+class StopFlag:
+    """
+    Shutdown request set from a signal handler. Setting it is a plain attribute
+    write, unlike multiprocessing.Event.set(), which takes the same lock as the
+    is_set() the loops poll and can deadlock when the signal lands while it is held.
+    """
+
+    def __init__(self):
+        self.stopped = False
+
+    def set(self, *_):
+        self.stopped = True
+
+    def is_set(self):
+        return self.stopped
+
+def worker_process(db_path, files_dir, poll_interval, torch_threads):
+    # Ctrl-C goes to the whole process group; let the parent coordinate shutdown.
+    # SIGTERM (sent by the parent) finishes the current batch, then exits.
+    stop = StopFlag()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, stop.set)
+    set_torch_threads(torch_threads)
+    run_worker(JobStore(db_path, files_dir), poll_interval=poll_interval, stop_event=stop)
+
+def requeue(store):
+    try:
+        requeued = store.requeue_orphaned_tasks()
+        if requeued:
+            print(f"Requeued {requeued} tasks left by stopped or stuck workers")
+    except Exception as e:
+        print(f"Requeue failed: {e}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Local worker pool for queued screening jobs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--db", default=JOBS_DB_PATH, help="Job database path (shared with server.py)")
+    parser.add_argument("--files_dir", default=JOBS_DIR, help="Folder where server.py stores job uploads")
+    parser.add_argument("--poll_interval", type=float, default=1.0, help="Seconds between polls when the queue is empty")
+    parser.add_argument("--check_interval", type=float, default=10.0,
+                        help="Seconds between checks for dead workers and expired task leases")
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        print("--workers must be at least 1")
+        return
+
+    store = JobStore(args.db, args.files_dir)
+    requeue(store)
+    warm_up_before_fork()
+
+    torch_threads = max(1, (os.cpu_count() or 1) // args.workers)
+    ctx = multiprocessing.get_context("fork") if hasattr(os, "fork") else multiprocessing.get_context()
+
+    stop = StopFlag()
+    signal.signal(signal.SIGTERM, stop.set)
+    signal.signal(signal.SIGINT, stop.set)
+
+    def spawn():
+        p = ctx.Process(target=worker_process, args=(args.db, args.files_dir, args.poll_interval, torch_threads))
+        p.start()
+        return p
+
+    procs = [spawn() for _ in range(args.workers)]
+    print(f"Started {len(procs)} workers on {args.db}")
+
+    # Supervise: replace workers that exit (crash, OOM kill) and hand their
+    # batches back to the queue so jobs still reach 'done'. Signals don't
+    # interrupt wait(), so it wakes every second to notice a stop request.
+    last_check = time.monotonic()
+    while not stop.is_set():
+        exited = wait([p.sentinel for p in procs], timeout=min(1.0, args.check_interval))
+        for p in [p for p in procs if p.sentinel in exited]:
+            p.join()  # reap first so its pid no longer looks alive
+            procs.remove(p)
+            if not stop.is_set():
+                print(f"Worker {p.pid} exited with code {p.exitcode}, starting a replacement")
+                procs.append(spawn())
+        if exited or time.monotonic() - last_check >= args.check_interval:
+            requeue(store)
+            last_check = time.monotonic()
+
+    print("Stopping workers after their current batch...")
+    for p in procs:
+        p.terminate()
+    for p in procs:
+        p.join()
+
+if __name__ == "__main__":
+    main()